@@ -0,0 +1,29 @@
+/*
+description: non-destructive upgrade that adds account_transact_counts
+    to an existing database and backfills it from transacts.
+    Safe to run against a live database and safe to re-run: rows that
+    already exist (e.g. seeded by the API in the meantime) are left alone.
+target: sqlite, postgres
+*/
+
+CREATE TABLE IF NOT EXISTS account_transact_counts (
+    account_id INTEGER PRIMARY KEY,
+    total_count BIGINT NOT NULL DEFAULT 0,
+    posted_count BIGINT NOT NULL DEFAULT 0,
+    deleted_count BIGINT NOT NULL DEFAULT 0,
+    FOREIGN KEY (account_id) REFERENCES accounts(account_id) ON DELETE CASCADE
+);
+
+-- WHERE true keeps SQLite from reading ON CONFLICT as a join constraint
+INSERT INTO account_transact_counts (account_id, total_count, posted_count, deleted_count)
+SELECT
+    t.account_id,
+    COUNT(*),
+    SUM(CASE WHEN t.trans_status = 'posted' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN t.trans_status = 'deleted' THEN 1 ELSE 0 END)
+FROM
+    transacts AS t
+WHERE true
+GROUP BY
+    t.account_id
+ON CONFLICT (account_id) DO NOTHING;
@@ -6,6 +6,7 @@ target: postgres
 -- 1. Drop all tables in order 
 -- to avoid foreign key constraints
 DROP VIEW IF EXISTS account_balances;
+DROP TABLE IF EXISTS account_transact_counts;
 DROP TABLE IF EXISTS transactions;
 DROP TABLE IF EXISTS transacts;
 DROP TABLE IF EXISTS accounts; 
@@ -43,6 +44,16 @@ CREATE TABLE transacts (
     FOREIGN KEY (account_id) REFERENCES accounts(account_id) ON DELETE CASCADE
 );
 
+-- Per-account transaction counts, kept in step with transacts by the API
+-- so paging never has to COUNT(*) an account's full history
+CREATE TABLE account_transact_counts (
+    account_id INTEGER PRIMARY KEY,
+    total_count BIGINT NOT NULL DEFAULT 0,
+    posted_count BIGINT NOT NULL DEFAULT 0,
+    deleted_count BIGINT NOT NULL DEFAULT 0,
+    FOREIGN KEY (account_id) REFERENCES accounts(account_id) ON DELETE CASCADE
+);
+
 -- 3. Create views
 
 -- View: balance = checkpoint + net(posted credits - debits) since checkpoint
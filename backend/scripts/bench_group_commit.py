@@ -0,0 +1,145 @@
+# backend/scripts/bench_group_commit.py
+"""
+Benchmark: one-commit-per-create vs. the group-commit write queue.
+
+Runs the same concurrent posting load twice against a scratch SQLite file
+and reports inserts/sec and commits/sec for each write path.
+
+Usage (from backend/):
+    python scripts/bench_group_commit.py --threads 32 --per-thread 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+# app.core.config requires these; the benchmark never talks to an IdP
+_tmpdir = tempfile.mkdtemp(prefix="oft-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmpdir}/bench.sqlite3")
+os.environ.setdefault("OIDC_ISSUER", "https://example.invalid")
+os.environ.setdefault("ALLOWED_ORIGINS", "http://localhost:5173")
+os.environ.setdefault("TRANSACTS_PAGE_SIZE", "10")
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.db.models import Base  # noqa: E402
+from app.db.models.users import User  # noqa: E402
+from app.db.models.accounts import Account  # noqa: E402
+from app.db.models.transacts import Transact  # noqa: E402
+from app.db.models.account_transact_counts import AccountTransactCount  # noqa: E402
+from app.db.transact_counts import bump_transact_counts  # noqa: E402
+from app.db.write_queue import TransactWriteQueue  # noqa: E402
+
+
+def make_db(path: str):
+    engine = create_engine(f"sqlite:///{path}", future=True, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _pragma(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON;")
+        cursor.execute("PRAGMA busy_timeout=30000;")
+        cursor.close()
+
+    Base.metadata.create_all(engine, tables=[User.__table__, Account.__table__, Transact.__table__, AccountTransactCount.__table__])
+    factory = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    with factory() as s:
+        user = User(email="bench@example.invalid", username="bench")
+        s.add(user)
+        s.flush()
+        account = Account(
+            user_id=user.user_id,
+            account_name="bench",
+            checkpoint_balance=0,
+            checkpoint_timestamp=datetime.utcnow(),
+        )
+        s.add(account)
+        s.commit()
+        return engine, factory, account.account_id
+
+
+def values_for(account_id: int, i: int) -> dict:
+    return dict(
+        account_id=account_id,
+        occurred_at=datetime.utcnow(),
+        amount_cents=100 + i,
+        direction="credit" if i % 2 else "debit",
+        trans_status="posted",
+        notes=f"bench {i}",
+    )
+
+
+def run_load(threads: int, per_thread: int, post) -> float:
+    def worker(t: int):
+        for i in range(per_thread):
+            post(t * per_thread + i)
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    start = time.perf_counter()
+    for th in pool:
+        th.start()
+    for th in pool:
+        th.join()
+    return time.perf_counter() - start
+
+
+def bench_direct(threads: int, per_thread: int) -> None:
+    engine, factory, account_id = make_db(os.path.join(_tmpdir, "direct.sqlite3"))
+    commits = 0
+    lock = threading.Lock()
+
+    def post(i: int):
+        nonlocal commits
+        with factory() as s:
+            s.add(Transact(**values_for(account_id, i)))
+            s.flush()
+            bump_transact_counts(s, account_id, total=1, posted=1)
+            s.commit()
+        with lock:
+            commits += 1
+
+    elapsed = run_load(threads, per_thread, post)
+    report("per-request commit", threads * per_thread, commits, elapsed)
+    engine.dispose()
+
+
+def bench_group(threads: int, per_thread: int, window_ms: int, max_batch: int) -> None:
+    engine, factory, account_id = make_db(os.path.join(_tmpdir, "group.sqlite3"))
+    wq = TransactWriteQueue(factory, window_ms=window_ms, max_batch=max_batch)
+    wq.start()
+    elapsed = run_load(threads, per_thread, lambda i: wq.submit(values_for(account_id, i)))
+    wq.stop()
+    report(f"group commit ({window_ms}ms)", wq.inserts, wq.commits, elapsed)
+    engine.dispose()
+
+
+def report(label: str, inserts: int, commits: int, elapsed: float) -> None:
+    print(
+        f"{label:<24} inserts={inserts:<7} commits={commits:<7} "
+        f"inserts/sec={inserts / elapsed:>10.1f} commits/sec={commits / elapsed:>10.1f} "
+        f"rows/commit={inserts / max(commits, 1):.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--per-thread", type=int, default=100)
+    parser.add_argument("--window-ms", type=int, default=5)
+    parser.add_argument("--max-batch", type=int, default=500)
+    args = parser.parse_args()
+
+    bench_direct(args.threads, args.per_thread)
+    bench_group(args.threads, args.per_thread, args.window_ms, args.max_batch)
+
+
+if __name__ == "__main__":
+    main()
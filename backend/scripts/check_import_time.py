@@ -0,0 +1,69 @@
+# backend/scripts/check_import_time.py
+"""
+Import-time budget check for the API.
+
+Imports `app.main` in a fresh interpreter with `-X importtime`, reports the
+slowest modules and exits non-zero when the cumulative import time of
+`app.main` is over budget. Run it in CI or before a deploy to keep cold
+starts fast.
+
+Usage (from backend/):
+    python scripts/check_import_time.py --budget-ms 1500
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def measure(runs: int) -> tuple[float, list[tuple[int, str]]]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    # app.core.config requires these; importing never connects or calls the IdP
+    env.setdefault("DATABASE_URL", f"sqlite:///{tempfile.gettempdir()}/oft-import-check.sqlite3")
+    env.setdefault("OIDC_ISSUER", "https://example.invalid")
+    env.setdefault("ALLOWED_ORIGINS", "http://localhost:5173")
+    env.setdefault("TRANSACTS_PAGE_SIZE", "10")
+
+    best_us = None
+    best_rows: list[tuple[int, str]] = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app.main"],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        rows = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            rows.append((int(cumulative), name))
+        total = next(us for us, name in rows if name == "app.main")
+        # Best of N filters out noise from a busy machine
+        if best_us is None or total < best_us:
+            best_us, best_rows = total, rows
+    return best_us / 1000.0, sorted(best_rows, reverse=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="max cumulative import time of app.main")
+    parser.add_argument("--runs", type=int, default=3, help="take the best of this many fresh imports")
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to report")
+    args = parser.parse_args()
+
+    total_ms, rows = measure(args.runs)
+    print(f"{'cumulative ms':>14}  module")
+    for us, name in rows[:args.top]:
+        print(f"{us / 1000.0:>14.1f}  {name}")
+    verdict = "OK" if total_ms <= args.budget_ms else "OVER BUDGET"
+    print(f"\nimport app.main: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms) {verdict}")
+    sys.exit(0 if total_ms <= args.budget_ms else 1)
+
+
+if __name__ == "__main__":
+    main()
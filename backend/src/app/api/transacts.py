@@ -1,13 +1,20 @@
 # backend/src/app/api/transacts.py
-from typing import Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.orm import Session
 from app.deps import get_db, get_current_user
 from app.db.models.users import User
 from app.db.models.accounts import Account
 from app.db.models.transacts import Transact
-from app.schemas import TransactsPage, TransactResponse, CreateTransactRequest, UpdateTransactRequest
+from app.db.write_queue import get_transact_write_queue, WriteQueueUnavailable, WriteQueueOutcomeUnknown
+from app.db.transact_counts import get_transact_counts, bump_transact_counts, bump_for_status_change
+from app.schemas import (
+    TransactsPage, TransactResponse, CreateTransactRequest, UpdateTransactRequest,
+    BatchUpdateItem, BatchUpdateTransactsRequest, BatchItemResult, BatchUpdateTransactsResponse,
+    BATCH_MAX_ITEMS,
+)
 from app.core.config import get_settings
 from datetime import datetime
 
@@ -50,12 +57,17 @@ def get_account_transacts(
         Transact.account_id == account_id
     ).order_by(Transact.occurred_at.desc())
     
-    # Get total count
-    total = db.scalar(
-        select(func.count()).select_from(
-            base_query.subquery()
+    # Get total count from the maintained per-account counts; fall back to
+    # counting only for accounts that have no counts row yet
+    counts = get_transact_counts(db, account_id)
+    if counts is not None:
+        total = counts.total_count
+    else:
+        total = db.scalar(
+            select(func.count()).select_from(
+                base_query.subquery()
+            )
         )
-    )
     
     # Get paginated items
     offset = (page - 1) * page_size
@@ -109,7 +121,7 @@ def create_account_transact(
         raise HTTPException(status_code=400, detail="Amount must be greater than 0")
     
     # Create new transaction
-    new_transact = Transact(
+    values = dict(
         account_id=account_id,
         occurred_at=datetime.utcnow(),
         amount_cents=transact_data.amount_cents,
@@ -118,11 +130,58 @@ def create_account_transact(
         notes=transact_data.notes
     )
     
-    db.add(new_transact)
-    db.flush()  # Flush to get generated ID, session_scope() will commit
+    write_queue = get_transact_write_queue()
+    if write_queue is not None:
+        # Group commit: batched with concurrent creates, committed by the writer.
+        # Release this request's connection first so waiting callers can't
+        # exhaust the pool the writer needs.
+        db.commit()
+        try:
+            new_transact = write_queue.submit(values)
+        except WriteQueueUnavailable:
+            # Known not written: safe for the client to retry
+            raise HTTPException(
+                status_code=503,
+                detail="Transaction was not recorded, retry later",
+                headers={"Retry-After": "1"},
+            )
+        except WriteQueueOutcomeUnknown:
+            # May still commit: no Retry-After, so clients check before re-posting
+            raise HTTPException(
+                status_code=504,
+                detail="Transaction could not be confirmed; check the account before retrying",
+            )
+    else:
+        new_transact = Transact(**values)
+        db.add(new_transact)
+        db.flush()  # Flush to get generated ID, session_scope() will commit
+        bump_transact_counts(db, account_id, total=1, posted=1)
     
     return TransactResponse.from_orm(new_transact)
 
+def _update_error(update_data: UpdateTransactRequest, current_status: str) -> Optional[str]:
+    """Return the 400 detail for an invalid update, or None if it may be applied."""
+    if update_data.amount_cents is not None and update_data.amount_cents <= 0:
+        return "Amount must be greater than 0"
+    
+    if update_data.direction is not None and update_data.direction not in ('credit', 'debit'):
+        return "Direction must be 'credit' or 'debit'"
+    
+    if update_data.trans_status is not None:
+        # Only allow transition to 'deleted' from 'posted'
+        if update_data.trans_status == 'deleted' and current_status != 'posted':
+            return "Can only soft-delete posted transactions"
+        
+        if update_data.trans_status not in ('posted', 'deleted'):
+            return "Status must be 'posted' or 'deleted'"
+    
+    return None
+
+def _update_values(update_data: UpdateTransactRequest) -> Dict[str, Any]:
+    """Column values to set for an update (fields left as None are untouched)."""
+    fields = ('notes', 'amount_cents', 'direction', 'trans_status')
+    return {f: getattr(update_data, f) for f in fields if getattr(update_data, f) is not None}
+
 # Add these endpoints to backend/src/app/api/transacts.py
 
 @router.get("/{account_id}/transacts/{trans_id}", response_model=TransactResponse)
@@ -190,41 +249,195 @@ def update_transaction(
     if not account:
         raise HTTPException(status_code=403, detail="Access denied to this account")
     
-    # Fetch transaction
+    # Fetch transaction (row-locked on PostgreSQL)
     transact = db.scalar(
         select(Transact).where(
             Transact.trans_id == trans_id,
             Transact.account_id == account_id
-        )
+        ).with_for_update()
     )
     
     if not transact:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
-    # Apply updates
-    if update_data.notes is not None:
-        transact.notes = update_data.notes
+    # Validate, then apply updates
+    old_status = transact.trans_status
+    error = _update_error(update_data, old_status)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    
+    changes = _update_values(update_data)
+    if changes:
+        # Only write if the status is still the one we validated against;
+        # FOR UPDATE is a no-op on SQLite, so this guard is what stops two
+        # concurrent PATCHes from both applying (and both bumping counts)
+        result = db.execute(
+            update(Transact)
+            .where(
+                Transact.trans_id == trans_id,
+                Transact.account_id == account_id,
+                Transact.trans_status == old_status
+            )
+            .values(changes)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise HTTPException(status_code=409, detail="Transaction was modified concurrently, retry")
+        if 'trans_status' in changes:
+            bump_for_status_change(db, account_id, old_status, changes['trans_status'])
+        db.refresh(transact)  # session_scope() will commit
+    
+    return TransactResponse.from_orm(transact)
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+BATCH_CHUNK_SIZE = 500
+
+def _chunks(seq: List[int], size: int = BATCH_CHUNK_SIZE):
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+@router.patch("/{account_id}/transacts", response_model=BatchUpdateTransactsResponse)
+def batch_update_transactions(
+    account_id: int,
+    batch: BatchUpdateTransactsRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Update or soft-delete many transactions in one request.
     
-    if update_data.amount_cents is not None:
-        if update_data.amount_cents <= 0:
-            raise HTTPException(status_code=400, detail="Amount must be greater than 0")
-        transact.amount_cents = update_data.amount_cents
+    - Accepts either a list of per-transaction updates (each an
+      UpdateTransactRequest plus trans_id), or a filter plus a trans_status
+      that every matching transaction is moved to
+    - Applies the same validation rules as the single-transaction PATCH,
+      including the posted -> deleted transition check
+    - Valid items are written with set-based UPDATEs in one transaction;
+      invalid items are skipped and reported, they do not fail the batch
+    - Returns a per-item outcome (200, 400, 404, or 409 when another
+      request changed the transaction's status mid-batch)
+    """
+    # Authorization: verify the account belongs to the current user
+    account = db.scalar(
+        select(Account).where(
+            Account.account_id == account_id,
+            Account.user_id == current_user.user_id
+        )
+    )
     
-    if update_data.direction is not None:
-        if update_data.direction not in ('credit', 'debit'):
-            raise HTTPException(status_code=400, detail="Direction must be 'credit' or 'debit'")
-        transact.direction = update_data.direction
+    if not account:
+        raise HTTPException(status_code=403, detail="Access denied to this account")
     
-    if update_data.trans_status is not None:
-        # Only allow transition to 'deleted' from 'posted'
-        if update_data.trans_status == 'deleted' and transact.trans_status != 'posted':
-            raise HTTPException(status_code=400, detail="Can only soft-delete posted transactions")
-        
-        if update_data.trans_status not in ('posted', 'deleted'):
+    # Filter mode: resolve the matches into per-transaction status updates
+    if batch.filter is not None:
+        if batch.trans_status not in ('posted', 'deleted'):
             raise HTTPException(status_code=400, detail="Status must be 'posted' or 'deleted'")
+        f = batch.filter
+        match = select(Transact.trans_id).where(Transact.account_id == account_id)
+        if f.trans_status is not None:
+            match = match.where(Transact.trans_status == f.trans_status)
+        if f.direction is not None:
+            match = match.where(Transact.direction == f.direction)
+        if f.occurred_from is not None:
+            match = match.where(Transact.occurred_at >= f.occurred_from)
+        if f.occurred_to is not None:
+            match = match.where(Transact.occurred_at < f.occurred_to)
+        if f.notes_contains is not None:
+            match = match.where(Transact.notes.contains(f.notes_contains, autoescape=True))
+        # Rows already in the target status need no change
+        match = match.where(Transact.trans_status != batch.trans_status)
+        trans_ids = db.scalars(match.order_by(Transact.trans_id).limit(BATCH_MAX_ITEMS + 1)).all()
+        if len(trans_ids) > BATCH_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Filter matches more than {BATCH_MAX_ITEMS} transactions; narrow it down",
+            )
+        items = [BatchUpdateItem(trans_id=trans_id, trans_status=batch.trans_status) for trans_id in trans_ids]
+    else:
+        items = batch.items
+    
+    # Current status of every referenced transaction, locked for the
+    # duration of the batch so the transition checks stay valid. Lock in
+    # id order so concurrent batches sharing ids cannot deadlock.
+    requested = sorted({item.trans_id for item in items})
+    current: Dict[int, str] = {}
+    for chunk in _chunks(requested):
+        current.update(db.execute(
+            select(Transact.trans_id, Transact.trans_status)
+            .where(Transact.account_id == account_id, Transact.trans_id.in_(chunk))
+            .order_by(Transact.trans_id)
+            .with_for_update()
+        ).all())
+    
+    # Validate each item; group the valid ones by the status they were
+    # validated against plus the exact values they set
+    seen = Counter(item.trans_id for item in items)
+    results: Dict[int, BatchItemResult] = {}
+    groups: Dict[tuple, List[int]] = {}
+    for item in items:
+        if item.trans_id in results:
+            continue
+        if seen[item.trans_id] > 1:
+            results[item.trans_id] = BatchItemResult(
+                trans_id=item.trans_id, status_code=400, detail="Duplicate trans_id in batch"
+            )
+            continue
+        if item.trans_id not in current:
+            results[item.trans_id] = BatchItemResult(
+                trans_id=item.trans_id, status_code=404, detail="Transaction not found"
+            )
+            continue
+        error = _update_error(item, current[item.trans_id])
+        if error:
+            results[item.trans_id] = BatchItemResult(trans_id=item.trans_id, status_code=400, detail=error)
+            continue
         
-        transact.trans_status = update_data.trans_status
+        changes = _update_values(item)
+        if changes:
+            key = (current[item.trans_id], tuple(sorted(changes.items())))
+            groups.setdefault(key, []).append(item.trans_id)
+        results[item.trans_id] = BatchItemResult(trans_id=item.trans_id, status_code=200)
     
-    db.flush()  # Flush changes, session_scope() will commit
+    # One UPDATE per (observed status, values) group; a bulk soft-delete is
+    # one group. The trans_status guard makes each UPDATE skip rows another
+    # request changed since we read them (FOR UPDATE is a no-op on SQLite),
+    # and the count deltas come from the rows actually updated.
+    status_delta = {'posted': 0, 'deleted': 0}
+    for (observed_status, values), trans_ids in groups.items():
+        values = dict(values)
+        for chunk in _chunks(trans_ids):
+            updated_ids = set(db.scalars(
+                update(Transact)
+                .where(
+                    Transact.account_id == account_id,
+                    Transact.trans_id.in_(chunk),
+                    Transact.trans_status == observed_status
+                )
+                .values(values)
+                .returning(Transact.trans_id)
+                .execution_options(synchronize_session=False)
+            ))
+            for tid in chunk:
+                if tid not in updated_ids:
+                    results[tid] = BatchItemResult(
+                        trans_id=tid, status_code=409, detail="Transaction was modified concurrently, retry"
+                    )
+            new_status = values.get('trans_status', observed_status)
+            if new_status != observed_status:
+                status_delta[observed_status] -= len(updated_ids)
+                status_delta[new_status] += len(updated_ids)
+    bump_transact_counts(db, account_id, **status_delta)
+    db.flush()  # session_scope() will commit
     
-    return TransactResponse.from_orm(transact)
\ No newline at end of file
+    # Re-read the updated rows for the response
+    ok_ids = [tid for tid, r in results.items() if r.status_code == 200]
+    db.expire_all()
+    for chunk in _chunks(ok_ids):
+        for transact in db.scalars(select(Transact).where(Transact.trans_id.in_(chunk))):
+            results[transact.trans_id].transact = TransactResponse.from_orm(transact)
+    
+    updated = len(ok_ids)
+    return BatchUpdateTransactsResponse(
+        results=list(results.values()),
+        updated=updated,
+        failed=len(results) - updated
+    )
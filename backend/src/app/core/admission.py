@@ -0,0 +1,203 @@
+# backend/src/app/core/admission.py
+"""
+Per-user admission control and load shedding.
+
+Requests are keyed by the verified JWT `sub` (falling back to client IP when
+the token is missing or invalid; the route itself still answers 401), then:
+
+- a per-user token bucket rejects bursts beyond the configured rate with 429
+- a per-user in-flight limit rejects with 429, so one user can hold only a
+  share of any route's concurrency cap
+- per-route concurrency caps reject with 503 once a route is saturated
+- global shedding rejects with 503 when in-flight depth or recent DB pool
+  wait passes its threshold
+
+Every rejection carries Retry-After, so well-behaved clients back off and the
+requests that are admitted keep a stable latency.
+"""
+from __future__ import annotations
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.routing import Match
+
+from app.core.config import get_settings
+from app.core.oidc import verify_jwt_and_get_claims
+
+# Paths that are never throttled (CORS preflight is handled by method).
+# Matched exactly; only the Swagger UI also owns sub-paths under /docs/.
+EXEMPT_PATHS = {"/docs", "/redoc", "/openapi.json", "/logout", "/ready"}
+
+
+def _is_exempt(path: str) -> bool:
+    return path in EXEMPT_PATHS or path.startswith("/docs/")
+
+
+@dataclass
+class TokenBucket:
+    rate: float      # tokens added per second
+    capacity: float  # burst size
+    tokens: float
+    updated: float
+
+    def take(self, now: float) -> float:
+        """Take one token; return 0 on success, else seconds until one is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class PoolWaitTracker:
+    """
+    Exponentially weighted average of how long requests waited for a DB
+    connection. Samples older than `stale_after` are ignored, so shedding
+    stops on its own once no fresh evidence of pressure arrives.
+    """
+
+    def __init__(self, alpha: float = 0.2, stale_after: float = 1.0):
+        self.alpha = alpha
+        self.stale_after = stale_after
+        self.avg = 0.0
+        self.updated = 0.0
+
+    def record(self, seconds: float) -> None:
+        now = time.monotonic()
+        if now - self.updated > self.stale_after:
+            self.avg = seconds
+        else:
+            self.avg += self.alpha * (seconds - self.avg)
+        self.updated = now
+
+    def current(self) -> float:
+        if time.monotonic() - self.updated > self.stale_after:
+            return 0.0
+        return self.avg
+
+
+pool_wait = PoolWaitTracker()
+
+
+def _reject(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": detail},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class AdmissionControlMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        settings = get_settings()
+        self.enabled = settings.admission_control
+        self.rate = settings.admission_user_rate
+        self.burst = settings.admission_user_burst
+        self.route_cap = settings.admission_route_concurrency
+        self.user_cap = settings.admission_user_concurrency
+        self.max_inflight = settings.admission_max_inflight
+        self.max_pool_wait = settings.admission_max_pool_wait_ms / 1000.0
+        self.max_buckets = 10000
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.route_inflight: Dict[str, int] = {}
+        self.user_inflight: Dict[str, int] = {}
+        self.inflight = 0
+
+    async def _client_key(self, request: Request) -> str:
+        auth = request.headers.get("authorization", "")
+        scheme, _, token = auth.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                claims = await verify_jwt_and_get_claims(token)
+            except Exception:
+                claims = None
+            if claims and claims.get("sub"):
+                # Hand the verified claims to deps so the token is checked once
+                request.state.jwt_token = token
+                request.state.jwt_claims = claims
+                return f"sub:{claims['sub']}"
+        client = request.client.host if request.client else "unknown"
+        return f"ip:{client}"
+
+    def _route_key(self, request: Request) -> Optional[str]:
+        for route in request.app.router.routes:
+            match, _ = route.matches(request.scope)
+            if match == Match.FULL:
+                return f"{request.method} {route.path}"
+        return None
+
+    def _take_token(self, key: str) -> float:
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= self.max_buckets:
+                self._prune(now)
+            bucket = self.buckets[key] = TokenBucket(self.rate, self.burst, self.burst, now)
+        return bucket.take(now)
+
+    def _prune(self, now: float) -> None:
+        # A bucket that has refilled completely carries no state worth keeping
+        full_after = self.burst / self.rate
+        for key in [k for k, b in self.buckets.items() if now - b.updated >= full_after]:
+            del self.buckets[key]
+
+    def _overloaded(self) -> Optional[Tuple[str, float]]:
+        if self.max_inflight and self.inflight >= self.max_inflight:
+            return "Server overloaded, retry later", 1.0
+        wait = pool_wait.current()
+        if self.max_pool_wait and wait > self.max_pool_wait:
+            return "Database saturated, retry later", wait
+        return None
+
+    async def dispatch(self, request: Request, call_next):
+        if (
+            not self.enabled
+            or request.method == "OPTIONS"
+            or _is_exempt(request.url.path)
+        ):
+            return await call_next(request)
+
+        # Cheapest checks first: global overload needs no token verification
+        overloaded = self._overloaded()
+        if overloaded:
+            return _reject(503, *overloaded)
+
+        key = await self._client_key(request)
+
+        # Route cap before the user's bucket: a request the server sheds must
+        # not cost the user a token
+        route = self._route_key(request)
+        if route and self.route_cap and self.route_inflight.get(route, 0) >= self.route_cap:
+            return _reject(503, "Too many concurrent requests for this endpoint", 1.0)
+
+        # Per-user in-flight limit keeps one user's slow burst from taking
+        # every slot of a route cap; also checked before charging a token
+        if self.user_cap and self.user_inflight.get(key, 0) >= self.user_cap:
+            return _reject(429, "Too many concurrent requests", 1.0)
+
+        retry_after = self._take_token(key)
+        if retry_after:
+            return _reject(429, "Rate limit exceeded", retry_after)
+
+        self.inflight += 1
+        self.user_inflight[key] = self.user_inflight.get(key, 0) + 1
+        if route:
+            self.route_inflight[route] = self.route_inflight.get(route, 0) + 1
+        try:
+            return await call_next(request)
+        finally:
+            self.inflight -= 1
+            self.user_inflight[key] -= 1
+            if not self.user_inflight[key]:
+                del self.user_inflight[key]
+            if route:
+                self.route_inflight[route] -= 1
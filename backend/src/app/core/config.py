@@ -16,6 +16,20 @@ class Settings(BaseSettings):
     allowed_origins: str  # Must be set via environment variable (comma-separated list)
     # Pagination settings
     transacts_page_size: int  # number of transactions per page
+    # Group commit for transaction posting (opt-in)
+    transacts_group_commit: bool = False  # coalesce concurrent creates into one INSERT + COMMIT
+    transacts_group_commit_window_ms: int = 5  # how long the writer waits to fill a batch
+    transacts_group_commit_max_batch: int = 500  # upper bound on rows per batch
+    # Admission control / load shedding
+    admission_control: bool = True  # set false to disable all limits below
+    admission_user_rate: float = 10.0  # sustained requests/sec per user (0 = unlimited)
+    admission_user_burst: float = 20.0  # token-bucket burst size per user (keep below the route cap)
+    admission_user_concurrency: int = 8  # max in-flight requests per user (0 = unlimited)
+    admission_route_concurrency: int = 32  # max in-flight requests per route (0 = unlimited)
+    admission_max_inflight: int = 200  # shed with 503 above this many in-flight requests (0 = off)
+    admission_max_pool_wait_ms: int = 250  # shed with 503 when recent DB pool wait exceeds this (0 = off)
+    # Startup warm-up (gates /ready)
+    startup_pool_connections: int = 5  # DB connections opened before reporting ready
 
     class Config:
         # keep your original behavior: read from a .env in backend/ working dir
@@ -2,19 +2,21 @@ from __future__ import annotations
 import time
 from typing import Any, Dict
 import httpx
-from jose import jwt
+from jose import jwk, jwt
 from app.core.config import get_settings
 
-settings = get_settings()
-DISCOVERY_URL = f"{settings.oidc_issuer}/.well-known/openid-configuration"
+# Settings are resolved on first use, not at import, to keep startup cheap
 _cache: Dict[str, Dict[str, Any]] = {}
 
+def _discovery_url() -> str:
+    return f"{get_settings().oidc_issuer}/.well-known/openid-configuration"
+
 async def _get_openid_config() -> Dict[str, Any]:
     now = time.time()
     if (c := _cache.get("openid")) and c["exp"] > now:
         return c["val"]
     async with httpx.AsyncClient(timeout=5.0) as c:
-        r = await c.get(DISCOVERY_URL)
+        r = await c.get(_discovery_url())
         r.raise_for_status()
         data = r.json()
     _cache["openid"] = {"val": data, "exp": now + 3600}
@@ -29,24 +31,37 @@ async def _get_jwks() -> Dict[str, Any]:
         r = await c.get(cfg["jwks_uri"])
         r.raise_for_status()
         data = r.json()
-    _cache["jwks"] = {"val": data, "exp": now + 3600}
+    # Parse each signing key once per JWKS fetch instead of once per request
+    keys = {}
+    for k in data.get("keys", []):
+        try:
+            keys[k.get("kid")] = jwk.construct(k, k.get("alg", "RS256"))
+        except Exception:
+            continue  # unsupported key type; never selected for verification
+    _cache["jwks"] = {"val": data, "keys": keys, "exp": now + 3600}
     return data
 
+async def prefetch_jwks() -> int:
+    """Warm the discovery + JWKS caches; returns the number of parsed signing keys."""
+    await _get_jwks()
+    return len(_cache["jwks"]["keys"])
+
 async def verify_jwt_and_get_claims(token: str) -> Dict[str, Any]:
     cfg = await _get_openid_config()
     jwks = await _get_jwks()
     header = jwt.get_unverified_header(token)
     kid = header.get("kid")
-    key = next((k for k in jwks["keys"] if k.get("kid") == kid), None)
-    if not key:
+    jwk_dict = next((k for k in jwks["keys"] if k.get("kid") == kid), None)
+    if not jwk_dict:
         raise ValueError("Signing key not found")
+    key = _cache["jwks"]["keys"].get(kid, jwk_dict)
     claims = jwt.decode(
         token,
-        key,                         # python-jose accepts JWK dicts
-        algorithms=[key.get("alg", "RS256")],
-        audience=(settings.oidc_audience or None),
+        key,                         # pre-parsed jose Key (falls back to the JWK dict)
+        algorithms=[jwk_dict.get("alg", "RS256")],
+        audience=(get_settings().oidc_audience or None),
         issuer=cfg["issuer"],
         options={"verify_at_hash": False},
     )
     # OIDC defines `sub` (subject) as the stable end-user id
-    return claims
\ No newline at end of file
+    return claims
@@ -7,4 +7,5 @@ class Base(DeclarativeBase):
 # These imports are intentionally unused but required so SQLAlchemy sees all models
 from . import users  # noqa: F401
 from . import accounts  # noqa: F401
-from . import transacts  # noqa: F401
\ No newline at end of file
+from . import transacts  # noqa: F401
+from . import account_transact_counts  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger, ForeignKey, text
+from sqlalchemy.orm import Mapped, mapped_column
+from . import Base
+
+class AccountTransactCount(Base):
+    """Per-account transaction counts, maintained alongside every insert and status change."""
+    __tablename__ = "account_transact_counts"
+
+    account_id:    Mapped[int] = mapped_column(ForeignKey("accounts.account_id", ondelete="CASCADE"), primary_key=True)
+
+    total_count:   Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    posted_count:  Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    deleted_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
@@ -0,0 +1,167 @@
+# backend/src/app/db/transact_counts.py
+"""
+Incrementally maintained per-account transaction counts.
+
+Every code path that inserts a Transact or changes its trans_status calls
+`bump_transact_counts()` inside the same DB transaction, so the counts commit
+(or roll back) together with the rows they describe. `repair_transact_counts()`
+recounts from `transacts` and fixes any drift, e.g. after a manual SQL edit or
+when upgrading an existing database.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.db.models.accounts import Account
+from app.db.models.account_transact_counts import AccountTransactCount
+from app.db.models.transacts import Transact
+
+logger = logging.getLogger("uvicorn.error")
+
+Counts = Tuple[int, int, int]  # (total, posted, deleted)
+
+
+def _upsert(db: Session):
+    # Both supported backends speak INSERT ... ON CONFLICT with the same API
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(AccountTransactCount)
+    return sqlite.insert(AccountTransactCount)
+
+
+def _count_columns(account_id: int):
+    return (
+        literal(account_id),
+        func.count(),
+        func.coalesce(func.sum(case((Transact.trans_status == "posted", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Transact.trans_status == "deleted", 1), else_=0)), 0),
+    )
+
+
+def bump_transact_counts(db: Session, account_id: int, total: int = 0, posted: int = 0, deleted: int = 0) -> None:
+    """
+    Apply count deltas for one account in the caller's transaction.
+
+    Call this after the transact change has been flushed. If the account has
+    no counts row yet (e.g. an upgraded database), the row is seeded from a
+    recount of `transacts`, which already includes the change, instead of
+    from the delta alone.
+    """
+    if not (total or posted or deleted):
+        return
+    stmt = _upsert(db).from_select(
+        ["account_id", "total_count", "posted_count", "deleted_count"],
+        select(*_count_columns(account_id)).where(Transact.account_id == account_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AccountTransactCount.account_id],
+        set_={
+            "total_count": AccountTransactCount.total_count + total,
+            "posted_count": AccountTransactCount.posted_count + posted,
+            "deleted_count": AccountTransactCount.deleted_count + deleted,
+        },
+    )
+    db.execute(stmt)
+
+
+def bump_for_status_change(db: Session, account_id: int, old_status: str, new_status: str) -> None:
+    """Move one (already flushed) transaction between the posted and deleted buckets."""
+    if old_status == new_status:
+        return
+    delta = {"posted": 0, "deleted": 0}
+    delta[old_status] -= 1
+    delta[new_status] += 1
+    bump_transact_counts(db, account_id, **delta)
+
+
+def get_transact_counts(db: Session, account_id: int) -> Optional[AccountTransactCount]:
+    return db.get(AccountTransactCount, account_id)
+
+
+def _recount(db: Session, account_ids: List[int]) -> Dict[int, Counts]:
+    rows = db.execute(
+        select(
+            Transact.account_id,
+            func.count(),
+            func.sum(case((Transact.trans_status == "posted", 1), else_=0)),
+            func.sum(case((Transact.trans_status == "deleted", 1), else_=0)),
+        )
+        .where(Transact.account_id.in_(account_ids))
+        .group_by(Transact.account_id)
+    ).all()
+    actual = {account_id: (0, 0, 0) for account_id in account_ids}
+    for account_id, total, posted, deleted in rows:
+        actual[account_id] = (total, posted or 0, deleted or 0)
+    return actual
+
+
+def _repair_chunk(session_scope: Callable, account_ids: List[int]) -> int:
+    with session_scope() as db:
+        # Lock the parent accounts rows (in id order) before recounting. New
+        # transacts and newly seeded count rows reference them by foreign key,
+        # so on PostgreSQL they wait for this transaction instead of landing
+        # between the recount and the absolute write. Then lock the existing
+        # count rows so status-change bumps queue behind us too. SQLite
+        # serialises writers, so the locks are no-ops there.
+        db.execute(
+            select(Account.account_id)
+            .where(Account.account_id.in_(sorted(account_ids)))
+            .order_by(Account.account_id)
+            .with_for_update()
+        ).all()
+        stored = {
+            c.account_id: (c.total_count, c.posted_count, c.deleted_count)
+            for c in db.scalars(
+                select(AccountTransactCount)
+                .where(AccountTransactCount.account_id.in_(account_ids))
+                .order_by(AccountTransactCount.account_id)
+                .with_for_update()
+            )
+        }
+        actual = _recount(db, account_ids)
+        fixed = 0
+        for account_id, counts in actual.items():
+            if stored.get(account_id) == counts:
+                continue
+            logger.info("Repairing transact counts for account %s: %s -> %s", account_id, stored.get(account_id), counts)
+            total, posted, deleted = counts
+            stmt = _upsert(db).values(
+                account_id=account_id, total_count=total, posted_count=posted, deleted_count=deleted,
+            )
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[AccountTransactCount.account_id],
+                set_={"total_count": total, "posted_count": posted, "deleted_count": deleted},
+            ))
+            fixed += 1
+        return fixed
+
+
+def repair_transact_counts(session_scope: Optional[Callable] = None, workers: int = 4, chunk_size: int = 100) -> int:
+    """
+    Recount every account's transactions and fix drifted rows.
+
+    Accounts are split into chunks that are recounted in parallel, each in its
+    own transaction. Returns the number of accounts that were corrected.
+    """
+    if session_scope is None:
+        from app.db.base import session_scope
+    with session_scope() as db:
+        account_ids = list(db.scalars(select(Account.account_id).order_by(Account.account_id)))
+    chunks = [account_ids[i:i + chunk_size] for i in range(0, len(account_ids), chunk_size)]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        return sum(ex.map(lambda chunk: _repair_chunk(session_scope, chunk), chunks))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Recount account_transact_counts and fix drift.")
+    parser.add_argument("--workers", type=int, default=4, help="accounts chunks recounted in parallel")
+    parser.add_argument("--chunk-size", type=int, default=100, help="accounts per transaction")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    fixed = repair_transact_counts(workers=args.workers, chunk_size=args.chunk_size)
+    print(f"Repaired transact counts for {fixed} account(s)")
@@ -0,0 +1,220 @@
+# backend/src/app/db/write_queue.py
+"""
+Opt-in group-commit write path for posting transactions.
+
+Concurrent creates that arrive within a short window are coalesced into one
+multi-row INSERT ... RETURNING and one COMMIT, so a burst of N posts pays for
+a single fsync instead of N. Each caller blocks on its own Future and gets
+back its own Transact row (and therefore its own trans_id).
+"""
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import get_settings
+from app.db.models.transacts import Transact
+from app.db.transact_counts import bump_transact_counts
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class WriteQueueUnavailable(RuntimeError):
+    """The insert was not written (queue stopped, dead, or the insert was withdrawn); safe to retry."""
+
+
+class WriteQueueOutcomeUnknown(RuntimeError):
+    """The writer took the insert but did not finish in time; it may still commit. Not safe to retry blindly."""
+
+
+@dataclass
+class _PendingInsert:
+    values: Dict[str, Any]
+    future: Future = field(default_factory=Future)
+
+
+class TransactWriteQueue:
+    """
+    Background writer that batches Transact inserts.
+
+    `commits` and `inserts` are running counters so callers (and the
+    benchmark script) can compare commits/sec against inserts/sec.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        window_ms: int = 5,
+        max_batch: int = 500,
+        write_timeout: float = 10.0,
+    ):
+        self._session_factory = session_factory
+        self._window = window_ms / 1000.0
+        # A caller waits at most for its batch window plus one slow write
+        self._timeout = self._window + write_timeout
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Optional[_PendingInsert]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self.commits = 0
+        self.inserts = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="transact-write-queue", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush whatever is queued, then stop the writer thread."""
+        if not self.running:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        # Anything still queued (the join timed out, or it arrived after the
+        # sentinel) will never be written: fail it so no caller waits forever
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if pending is not None:
+                pending.future.cancel()
+
+    def submit(self, values: Dict[str, Any]) -> Transact:
+        """
+        Queue one insert and block until its batch has been committed.
+
+        Raises WriteQueueUnavailable if the insert is known not to have been
+        written (writer not running, stopped with the insert still queued, or
+        timed out before picking it up), and WriteQueueOutcomeUnknown if the
+        writer had already taken it when the timeout expired.
+        """
+        if not self.running:
+            raise WriteQueueUnavailable("Transact write queue is not running")
+        pending = _PendingInsert(values)
+        self._queue.put(pending)
+        try:
+            return pending.future.result(timeout=self._timeout)
+        except CancelledError:
+            raise WriteQueueUnavailable("Transact write queue stopped before the insert was written")
+        except FutureTimeoutError:
+            # Withdraw it if the writer has not picked it up yet; once the
+            # writer holds it, the row may still be committed
+            if pending.future.cancel():
+                raise WriteQueueUnavailable("Timed out waiting for the transact write queue")
+            raise WriteQueueOutcomeUnknown("Transact write queue did not confirm the insert in time")
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            # Keep collecting until the window closes or the batch is full
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            # Skip inserts whose callers already gave up (timed out or stopped)
+            batch = [p for p in batch if p.future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                self._flush(batch)
+            except Exception as exc:
+                # Never let the writer thread die with callers still waiting
+                logger.exception("Transact write queue flush failed")
+                for p in batch:
+                    if not p.future.done():
+                        p.future.set_exception(exc)
+
+    def _flush(self, batch: List[_PendingInsert]) -> None:
+        try:
+            rows = self._write([p.values for p in batch])
+        except Exception as exc:
+            if len(batch) == 1:
+                batch[0].future.set_exception(exc)
+                return
+            # One bad row must not fail its neighbours: retry each on its own
+            logger.warning("Group commit of %d transacts failed, retrying individually: %s", len(batch), exc)
+            for p in batch:
+                try:
+                    p.future.set_result(self._write([p.values])[0])
+                except Exception as item_exc:
+                    p.future.set_exception(item_exc)
+            return
+        for p, row in zip(batch, rows):
+            p.future.set_result(row)
+
+    def _write(self, values: List[Dict[str, Any]]) -> List[Transact]:
+        s = self._session_factory()
+        try:
+            # sort_by_parameter_order keeps RETURNING rows aligned with callers
+            rows = s.scalars(
+                insert(Transact).returning(Transact, sort_by_parameter_order=True),
+                values,
+            ).all()
+            posted_per_account = Counter(row.account_id for row in rows)
+            for account_id, n in posted_per_account.items():
+                bump_transact_counts(s, account_id, total=n, posted=n)
+            s.commit()
+        except:
+            s.rollback()
+            raise
+        finally:
+            s.close()
+        self.commits += 1
+        self.inserts += len(rows)
+        return rows
+
+
+_write_queue: Optional[TransactWriteQueue] = None
+_write_queue_lock = threading.Lock()
+
+
+def get_transact_write_queue() -> Optional[TransactWriteQueue]:
+    """Return the shared write queue, or None when group commit is disabled."""
+    global _write_queue
+    settings = get_settings()
+    if not settings.transacts_group_commit:
+        return None
+    with _write_queue_lock:
+        if _write_queue is None:
+            from app.db.base import SessionLocal
+            _write_queue = TransactWriteQueue(
+                SessionLocal,
+                window_ms=settings.transacts_group_commit_window_ms,
+                max_batch=settings.transacts_group_commit_max_batch,
+            )
+            _write_queue.start()
+    return _write_queue
+
+
+def shutdown_transact_write_queue() -> None:
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is not None:
+            _write_queue.stop()
+            _write_queue = None
@@ -1,6 +1,7 @@
 # backend/src/app/deps.py
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+import time
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -8,18 +9,31 @@ from sqlalchemy.orm import Session
 from app.db.base import session_scope
 from app.db.models.users import User
 from app.core.oidc import verify_jwt_and_get_claims
+from app.core.admission import pool_wait
 
 # ---- DB session dependency (unchanged behavior) ----
 def get_db() -> Generator[Session, None, None]:
     # Same pattern you already use: one SQLAlchemy Session per request,
     # closed automatically after the response.
     with session_scope() as s:
+        # Check out the connection up front so admission control can see
+        # how long requests are waiting on the pool
+        started = time.monotonic()
+        s.connection()
+        pool_wait.record(time.monotonic() - started)
         yield s
 
 # ---- Auth boundary: Bearer token -> claims -> user_id ----
 bearer = HTTPBearer(auto_error=True)  # standard FastAPI security helper
 
+async def _verified_claims(request: Request, token: str) -> dict:
+    # Admission control may already have verified this exact token
+    if getattr(request.state, "jwt_token", None) == token:
+        return request.state.jwt_claims
+    return await verify_jwt_and_get_claims(token)
+
 async def get_current_user_id(
+    request: Request,
     creds: HTTPAuthorizationCredentials = Depends(bearer),
     db: Session = Depends(get_db),
 ) -> int:
@@ -29,7 +43,7 @@ async def get_current_user_id(
     """
     token = creds.credentials
     try:
-        claims = await verify_jwt_and_get_claims(token)
+        claims = await _verified_claims(request, token)
     except Exception:
         # Token missing/invalid/expired, wrong issuer/audience, bad signature, etc.
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
@@ -56,6 +70,7 @@ async def get_current_user_id(
         raise
 
 async def get_current_user(
+    request: Request,
     creds: HTTPAuthorizationCredentials = Depends(bearer),
     db: Session = Depends(get_db),
 ) -> User:
@@ -65,7 +80,7 @@ async def get_current_user(
     """
     token = creds.credentials
     try:
-        claims = await verify_jwt_and_get_claims(token)
+        claims = await _verified_claims(request, token)
     except Exception:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
@@ -1,13 +1,18 @@
 # backend/src/app/main.py
+import asyncio
 from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
+from app.core.admission import AdmissionControlMiddleware
 
 # at top
 import logging
 from pathlib import Path
 from app.db.base import engine
+from app.db.write_queue import shutdown_transact_write_queue
+from app.startup import readiness, run_warm_up
 
 settings = get_settings()
 app = FastAPI(title="OFT Transacts API")
@@ -19,12 +24,17 @@ allow_origins = [
     if o.strip()
 ]
 
+# --- Admission control: added before CORS so 429/503 responses still carry
+# CORS headers and the browser can read Retry-After ---
+app.add_middleware(AdmissionControlMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allow_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"], # allow all headers
+    expose_headers=["Retry-After"], # let browsers read backoff hints on 429/503
 )
 
 @app.post("/logout")
@@ -44,6 +54,32 @@ async def log_db_url():
         db_path = engine.url.database  # absolute path
         logger.info(f"SQLite path exists? {Path(db_path).exists()} path={db_path}")
 
+# Warm the pool, JWKS and statement caches in the background; /ready gates on it
+_warm_up_task = None
+
+@app.on_event("startup")
+async def start_warm_up():
+    global _warm_up_task
+    _warm_up_task = asyncio.create_task(run_warm_up())
+
+@app.get("/ready")
+def ready():
+    # Unauthenticated: failure details are logged by run_warm_up, never returned
+    if not readiness.ready:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "warming"},
+            headers={"Retry-After": "1"},
+        )
+    return {"status": "ready", **readiness.details}
+
+# Stop background work: a still-retrying warm-up and the group-commit writer
+@app.on_event("shutdown")
+def stop_background_tasks():
+    if _warm_up_task is not None:
+        _warm_up_task.cancel()
+    shutdown_transact_write_queue()
+
 # --- Security headers (CSP, etc.) ---
 OIDC_ISSUER = getattr(settings, "oidc_issuer", "")
 # Default CSP for the API
@@ -1,5 +1,5 @@
 # backend/src/app/schemas.py
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, root_validator, validator
 from datetime import datetime
 from typing import List, Optional
 
@@ -65,4 +65,56 @@ class UpdateTransactRequest(BaseModel):
                 raise ValueError('Amount must be greater than 0')
             if v > 9223372036854775807:  # PostgreSQL BIGINT max
                 raise ValueError('Amount exceeds maximum allowed value')
-        return v
\ No newline at end of file
+        return v
+
+# Upper bound on transactions touched by one batch request (items or filter matches)
+BATCH_MAX_ITEMS = 10000
+
+class BatchUpdateItem(UpdateTransactRequest):
+    trans_id: int
+
+class TransactFilter(BaseModel):
+    trans_status: Optional[str] = None  # 'posted' | 'deleted'
+    direction: Optional[str] = None  # 'credit' | 'debit'
+    occurred_from: Optional[datetime] = None  # inclusive
+    occurred_to: Optional[datetime] = None  # exclusive
+    notes_contains: Optional[str] = None
+
+    @root_validator(skip_on_failure=True)
+    def require_criterion(cls, values):
+        # An empty filter would match the whole account ('' matches every note)
+        if not any(v for v in values.values()):
+            raise ValueError('Filter needs at least one criterion')
+        return values
+
+class BatchUpdateTransactsRequest(BaseModel):
+    # Either explicit per-transaction updates...
+    items: Optional[List[BatchUpdateItem]] = Field(None, max_items=BATCH_MAX_ITEMS)
+    # ...or a filter plus the status to move every match to
+    filter: Optional[TransactFilter] = None
+    trans_status: Optional[str] = None  # 'posted' | 'deleted', only with filter
+
+    @validator('trans_status', always=True)
+    def validate_mode(cls, v, values):
+        if 'items' not in values or 'filter' not in values:
+            return v  # items/filter failed validation; that error is enough
+        has_items = values.get('items') is not None
+        has_filter = values.get('filter') is not None
+        if has_items == has_filter:
+            raise ValueError('Provide exactly one of items or filter')
+        if has_filter and v is None:
+            raise ValueError('trans_status is required with filter')
+        if has_items and v is not None:
+            raise ValueError('trans_status is only allowed with filter; set it per item instead')
+        return v
+
+class BatchItemResult(BaseModel):
+    trans_id: int
+    status_code: int  # 200 | 400 | 404 | 409
+    detail: Optional[str] = None
+    transact: Optional[TransactResponse] = None
+
+class BatchUpdateTransactsResponse(BaseModel):
+    results: List[BatchItemResult]
+    updated: int
+    failed: int
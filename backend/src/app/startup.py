@@ -0,0 +1,107 @@
+# backend/src/app/startup.py
+"""
+Startup warm-up and readiness.
+
+Right after boot the first authenticated request would otherwise pay for
+OIDC discovery + JWKS fetches, fresh DB connects and first-time SQL
+compilation. `run_warm_up()` does that work up front (retrying until it
+succeeds) and `/ready` only answers 200 once it has finished, so a load
+balancer keeps traffic away from cold instances.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import configure_mappers
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.oidc import prefetch_jwks
+from app.db.base import engine, session_scope
+from app.db.models.users import User
+from app.db.models.accounts import Account
+from app.db.models.account_balances import AccountBalance
+from app.db.models.account_transact_counts import AccountTransactCount
+from app.db.models.transacts import Transact
+
+logger = logging.getLogger("uvicorn.error")
+
+
+@dataclass
+class Readiness:
+    ready: bool = False
+    error: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+readiness = Readiness()
+
+
+def warm_pool(n: int) -> int:
+    """Open n pool connections at once so they are all established and pooled."""
+    if hasattr(engine.pool, "size"):
+        n = min(n, engine.pool.size())
+    conns = []
+    try:
+        for _ in range(n):
+            conn = engine.connect()
+            conns.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            conn.close()  # returned to the pool, still open
+    return len(conns)
+
+
+def warm_statements() -> None:
+    """
+    Run the hot request-path statements once with ids that match nothing.
+    This configures the mappers and fills SQLAlchemy's compiled-statement
+    cache, so the first real request skips SQL compilation.
+    """
+    configure_mappers()
+    with session_scope() as s:
+        s.scalar(select(User).where(User.email == ""))
+        s.execute(
+            select(Account.account_id, Account.account_name, Account.currency, AccountBalance.balance)
+            .join(AccountBalance, Account.account_id == AccountBalance.account_id)
+            .where(Account.user_id == -1)
+        ).all()
+        s.scalar(select(Account).where(Account.account_id == -1, Account.user_id == -1))
+        s.get(AccountTransactCount, -1)
+        s.scalars(
+            select(Transact).where(Transact.account_id == -1)
+            .order_by(Transact.occurred_at.desc()).limit(1).offset(0)
+        ).all()
+        s.scalar(select(Transact).where(Transact.trans_id == -1, Transact.account_id == -1))
+
+
+async def warm_up() -> None:
+    settings = get_settings()
+    # Connecting and the IdP round-trips are independent; overlap them
+    pooled, keys = await asyncio.gather(
+        run_in_threadpool(warm_pool, settings.startup_pool_connections),
+        prefetch_jwks(),
+    )
+    await run_in_threadpool(warm_statements)
+    readiness.details = {"pool_connections": pooled, "jwks_keys": keys}
+
+
+async def run_warm_up(max_delay: float = 30.0) -> None:
+    """Warm up, retrying with backoff until it succeeds; then mark the app ready."""
+    delay = 1.0
+    while True:
+        try:
+            await warm_up()
+        except Exception as exc:
+            readiness.error = f"{type(exc).__name__}: {exc}"
+            logger.warning(f"Startup warm-up failed, retrying in {delay:.0f}s: {readiness.error}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+            continue
+        readiness.ready = True
+        readiness.error = None
+        logger.info(f"Startup warm-up complete: {readiness.details}")
+        return